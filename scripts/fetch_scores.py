@@ -2,11 +2,49 @@
 import os
 import sys
 import json
+import gzip
+import time
+import urllib.error
 import urllib.request
 import urllib.parse
 import ssl
 from pathlib import Path
 
+# Shared HTTPS opener so additional fetches (other sports/date windows) reuse
+# one SSL context; responses are requested gzip-compressed.
+SSL_CONTEXT = ssl.create_default_context()
+OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=SSL_CONTEXT))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+
+
+def fetch(url, timeout=20):
+    """GET url and return the (decompressed) body bytes, retrying transient failures."""
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    attempt = 0
+    while True:
+        try:
+            with OPENER.open(request, timeout=timeout) as resp:
+                data = resp.read()
+                if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                    data = gzip.decompress(data)
+                return data
+        except urllib.error.HTTPError as e:
+            e.close()
+            if e.code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                raise
+        except urllib.error.URLError as e:
+            # Certificate failures are permanent; retrying won't help
+            if isinstance(e.reason, ssl.SSLCertVerificationError) or attempt >= MAX_RETRIES:
+                raise
+        except (TimeoutError, ConnectionError):
+            # Raised unwrapped when the connection drops or stalls during resp.read()
+            if attempt >= MAX_RETRIES:
+                raise
+        time.sleep(BACKOFF_FACTOR * (2 ** attempt))
+        attempt += 1
+
 
 def main():
     api_key = os.environ.get("ODDS_API_KEY")
@@ -28,20 +66,17 @@ def main():
 
     print(f"Fetching scores for {sport_key} (daysFrom={days_from})...")
 
-    ctx = ssl.create_default_context()
     try:
-        with urllib.request.urlopen(url, context=ctx, timeout=20) as resp:
-            status = resp.getcode()
-            if status != 200:
-                print(f"ERROR: HTTP {status}")
-                sys.exit(1)
-            data = resp.read()
+        data = fetch(url, timeout=20)
+    except urllib.error.HTTPError as e:
+        print(f"ERROR: HTTP {e.code}")
+        sys.exit(1)
     except Exception as e:
         print(f"ERROR: Failed to fetch scores: {e}")
         sys.exit(1)
 
     try:
-        payload = json.loads(data.decode("utf-8"))
+        payload = json.loads(data)
     except Exception as e:
         print(f"ERROR: Failed to parse JSON: {e}")
         sys.exit(1)
@@ -50,10 +85,11 @@ def main():
         print("ERROR: Unexpected response format (expected a list)")
         sys.exit(1)
 
-    valid = []
-    for item in payload:
-        if isinstance(item, dict) and item.get("id") and item.get("home_team") and item.get("away_team"):
-            valid.append(item)
+    # JSON objects always decode to plain dicts, so an exact type check suffices
+    valid = [
+        item for item in payload
+        if type(item) is dict and item.get("id") and item.get("home_team") and item.get("away_team")
+    ]
 
     print(f"Fetched {len(payload)} items; {len(valid)} passed basic validation.")
 
@@ -65,8 +101,11 @@ def main():
     scores_path = data_dir / "scores.json"
 
     try:
-        with new_scores_path.open("w", encoding="utf-8") as f:
-            json.dump(valid, f, indent=2)
+        # Flush and fsync before the rename so a crash can't leave an empty scores.json
+        with new_scores_path.open("wb") as f:
+            f.write(json.dumps(valid, indent=2).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
         print(f"Wrote {new_scores_path}.")
     except Exception as e:
         print(f"ERROR: Failed to write {new_scores_path}: {e}")
@@ -1,44 +1,71 @@
 #!/usr/bin/env python3
 import json
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
+from datetime import datetime, timedelta
 
 ROOT = Path(__file__).resolve().parents[1]
 MY_EVENTS = ROOT / 'data' / 'my_events.json'
 EVENTS = ROOT / 'data' / 'events.json'
 DATA_DIR = ROOT / 'data'
 
+_PAREN_RE = re.compile(r"\(.*?\)")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_GAME_FILE_RE = re.compile(r'^game-(.+?)-vs-(.+)-(\d{4}-\d{2}-\d{2})\.json$')
+
 def load_json(path: Path):
     try:
-        with path.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(path.read_bytes())
     except FileNotFoundError:
         raise SystemExit(f"Missing file: {path}")
     except json.JSONDecodeError as e:
         raise SystemExit(f"Invalid JSON in {path}: {e}")
 
-def build_event_map(events):
-    mapping = {}
-    for ev in events:
-        ev_id = ev.get('id')
-        if not ev_id:
-            continue
-        mapping[ev_id] = {
-            'home_team': ev.get('home_team') or ev.get('home') or ev.get('homeTeam'),
-            'away_team': ev.get('away_team') or ev.get('away') or ev.get('awayTeam'),
-            'commence_time': ev.get('commence_time')
-        }
-    return mapping
-
+@lru_cache(maxsize=4096)
 def slugify(name: str) -> str:
     if not name:
         return 'team'
     s = name.lower()
-    s = re.sub(r"\(.*?\)", "", s)
+    s = _PAREN_RE.sub("", s)
     s = s.replace('&', ' and ')
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip('-')
-    return s
+    return _NONALNUM_RE.sub("-", s).strip('-')
+
+def date_only(iso: str) -> str:
+    try:
+        return str(iso).split('T')[0]
+    except Exception:
+        return ''
+
+def alt_dates(d: str):
+    # Return candidate date strings [d, d-1, d+1]; adjacent days are a timezone fallback
+    try:
+        base = datetime.strptime(d, '%Y-%m-%d')
+        return [
+            (base + timedelta(days=delta)).strftime('%Y-%m-%d')
+            for delta in (0, -1, 1)
+        ]
+    except Exception:
+        return [d]
+
+def build_event_index(events):
+    # Map (date, {slug(home), slug(away)}) -> first matching event, built in one pass.
+    # Keyed on slugify() so game filenames and my_events rows hit the same index.
+    index = {}
+    for e in events:
+        key = (date_only(e.get('commence_time')), frozenset({slugify(e.get('home_team')), slugify(e.get('away_team'))}))
+        index.setdefault(key, e)
+    return index
+
+def find_event(event_index, date: str, slug_a: str, slug_b: str):
+    teams = frozenset({slug_a, slug_b})
+    for d in alt_dates(date):
+        match = event_index.get((d, teams))
+        if match:
+            return match
+    return None
 
 def find_game_file(away: str, home: str, date_str: str) -> Path:
     away_slug = slugify(away)
@@ -46,34 +73,53 @@ def find_game_file(away: str, home: str, date_str: str) -> Path:
     fname = f"game-{away_slug}-vs-{home_slug}-{date_str}.json"
     return DATA_DIR / fname
 
-def file_is_empty(path: Path) -> bool:
-    if not path.exists():
-        return False
+def is_blank(path, size: int) -> bool:
+    if size == 0:
+        return True
     try:
-        content = path.read_text(encoding='utf-8').strip()
-        return content == ''
+        with open(path, 'rb') as f:
+            head = f.read(64).lstrip()
+            # Real game JSON starts with '{': the first ASCII non-whitespace byte settles it
+            if head and head[0] < 0x80:
+                return False
+            rest = f.read()
+        return (head + rest).decode('utf-8').strip() == ''
     except Exception:
         return False
 
+def file_is_empty(path: Path) -> bool:
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    return is_blank(path, size)
+
+def empty_game_files():
+    # One scandir pass with no per-file Path objects. is_file() is usually answered
+    # from d_type; e.stat() still costs one stat() per entry that passes the name filter
+    with os.scandir(DATA_DIR) as it:
+        entries = [
+            e for e in it
+            if e.name.startswith('game-') and e.name.endswith('.json')
+            and e.is_file() and is_blank(e.path, e.stat().st_size)
+        ]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+def print_prompt(away: str, home: str, ev_id: str, fname: str):
+    # Emit the whole prompt block with one write instead of separate print() calls
+    sys.stdout.write(
+        f"Following the instructions in the project, lets look at {away} at {home}. Use {ev_id} for the game_id.\n"
+        f"Paste content into: {fname}\n\n"
+    )
+
 def main():
     my_events = load_json(MY_EVENTS)
     all_events = load_json(EVENTS)
-    event_map = build_event_map(all_events)
+    event_index = build_event_index(all_events)
     printed = set()
 
     # First path: prompts based on my_events, but only for files that are empty
-    def alt_dates(d: str):
-        # Return candidate date strings {d, d-1, d+1} for timezone tolerance
-        try:
-            from datetime import datetime, timedelta
-            base = datetime.strptime(d, '%Y-%m-%d')
-            return {
-                (base + timedelta(days=delta)).strftime('%Y-%m-%d')
-                for delta in (-1, 0, 1)
-            }
-        except Exception:
-            return {d}
-
     for ev in my_events:
         # Prefer matching via events.json by date+teams to get the authoritative id
         date = (ev.get('date') or '').strip()
@@ -82,27 +128,8 @@ def main():
         if not date or not team1 or not team2:
             continue
 
-        # Find candidate in events.json by date
-        def date_only(iso: str) -> str:
-            try:
-                return str(iso).split('T')[0]
-            except Exception:
-                return ''
-
-        # Build reverse lookup by normalized team names
-        date_set = alt_dates(date)
-        candidates = [e for e in all_events if date_only(e.get('commence_time')) in date_set]
-
-        def norm(s: str) -> str:
-            return re.sub(r"-+", '-', re.sub(r"[^a-z0-9]+", '-', re.sub(r"\(.*?\)", '', (s or '').lower()))).strip('-')
-
-        match = None
-        for e in candidates:
-            home = e.get('home_team')
-            away = e.get('away_team')
-            if (norm(home) == norm(team2) and norm(away) == norm(team1)) or (norm(home) == norm(team1) and norm(away) == norm(team2)):
-                match = e
-                break
+        # Look up by date + slugged team pair (either home/away orientation)
+        match = find_event(event_index, date, slugify(team1), slugify(team2))
 
         # If we can't find a match, skip prompt
         if not match:
@@ -117,48 +144,28 @@ def main():
         if ev_id and file_is_empty(game_path):
             key = (game_path.name)
             if key not in printed:
-                print(f"Following the instructions in the project, lets look at {away} at {home}. Use {ev_id} for the game_id.")
-                print(f"Paste content into: {game_path.name}\n")
+                print_prompt(away, home, ev_id, game_path.name)
                 printed.add(key)
 
     # Second path: scan for any empty game files and prompt regardless of my_events
-    for path in sorted(DATA_DIR.glob('game-*-vs-*-*.json')):
-        if not file_is_empty(path):
-            continue
-        m = re.match(r'^game-(.+)-vs-(.+)-(\d{4}-\d{2}-\d{2})\.json$', path.name)
+    for entry in empty_game_files():
+        m = _GAME_FILE_RE.match(entry.name)
         if not m:
             continue
         away_slug, home_slug, date = m.group(1), m.group(2), m.group(3)
 
-        # Find matching event on same date
-        def date_only(iso: str) -> str:
-            try:
-                return str(iso).split('T')[0]
-            except Exception:
-                return ''
-
-        date_set = alt_dates(date)
-        candidates = [e for e in all_events if date_only(e.get('commence_time')) in date_set]
-        match = None
-        for e in candidates:
-            if slugify(e.get('away_team')) == away_slug and slugify(e.get('home_team')) == home_slug:
-                match = e
-                break
-            if slugify(e.get('away_team')) == home_slug and slugify(e.get('home_team')) == away_slug:
-                match = e
-                break
-
+        # Find matching event on same date (±1 day), either orientation
+        match = find_event(event_index, date, away_slug, home_slug)
         if not match:
             continue
         away = match.get('away_team')
         home = match.get('home_team')
         ev_id = match.get('id')
 
-        key = (path.name)
+        key = (entry.name)
         if key in printed:
             continue
-        print(f"Following the instructions in the project, lets look at {away} at {home}. Use {ev_id} for the game_id.")
-        print(f"Paste content into: {path.name}\n")
+        print_prompt(away, home, ev_id, entry.name)
         printed.add(key)
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -9,19 +10,49 @@ DATA_DIR = ROOT / 'data'
 MY_EVENTS = DATA_DIR / 'my_events.json'
 EVENTS = DATA_DIR / 'events.json'
 
+_PAREN_RE = re.compile(r"\(.*?\)")
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+
 def load_json(path: Path):
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+    return json.loads(path.read_bytes())
 
+@lru_cache(maxsize=4096)
 def slugify(name: str) -> str:
     if not name:
         return 'team'
     s = name.lower()
-    s = re.sub(r"\(.*?\)", "", s)          # remove parentheticals e.g., (FL)
+    s = _PAREN_RE.sub("", s)                # remove parentheticals e.g., (FL)
     s = s.replace('&', ' and ')
-    s = re.sub(r"[^a-z0-9]+", "-", s)       # non-alnum to hyphen
-    s = re.sub(r"-+", "-", s).strip('-')    # collapse dashes
-    return s
+    return _NONALNUM_RE.sub("-", s).strip('-')   # non-alnum runs to a single hyphen
+
+def date_only(iso: str) -> str:
+    try:
+        return str(iso).split('T')[0]
+    except Exception:
+        return ''
+
+@lru_cache(maxsize=4096)
+def norm(s: str) -> str:
+    return _NONALNUM_RE.sub('-', _PAREN_RE.sub('', (s or '').lower())).strip('-')
+
+def build_event_index(events):
+    # Map (date, {norm(home), norm(away)}) -> first matching event, built in one pass
+    index = {}
+    for e in events:
+        key = (date_only(e.get('commence_time')), frozenset({norm(e.get('home_team')), norm(e.get('away_team'))}))
+        index.setdefault(key, e)
+    return index
+
+def find_event(event_index, date: str, team1: str, team2: str):
+    # Exact date first; ±1 day is a fallback for timezone formatting differences
+    base = datetime.strptime(date, '%Y-%m-%d')
+    teams = frozenset({norm(team1), norm(team2)})
+    for delta in (0, -1, 1):
+        d = (base + timedelta(days=delta)).strftime('%Y-%m-%d')
+        match = event_index.get((d, teams))
+        if match:
+            return match
+    return None
 
 def parse_et_datetime(date_str: str, time_str: str) -> str:
     """Return ISO string with EDT offset (-04:00) for simplicity in September."""
@@ -44,7 +75,7 @@ def parse_et_datetime(date_str: str, time_str: str) -> str:
     except Exception:
         return f"{date_str}T{hour:02d}:{minute:02d}:00-04:00"
 
-def ensure_game_file(ev, all_events):
+def ensure_game_file(ev, event_index):
     # Only create a file when this event can be matched to events.json (so we have an ID)
     date = (ev.get('date') or '').strip()
     team1 = (ev.get('team1') or '').strip()
@@ -53,31 +84,7 @@ def ensure_game_file(ev, all_events):
         print("⚠️ Skipping malformed my_events entry (missing date/team):", ev)
         return None
 
-    def date_only(iso: str) -> str:
-        try:
-            return str(iso).split('T')[0]
-        except Exception:
-            return ''
-
-    def norm(s: str) -> str:
-        return re.sub(r"-+", '-', re.sub(r"[^a-z0-9]+", '-', re.sub(r"\(.*?\)", '', (s or '').lower()))).strip('-')
-
-    # Allow ±1 day tolerance to account for timezone formatting differences
-    base = datetime.strptime(date, '%Y-%m-%d')
-    date_set = {
-        (base + timedelta(days=delta)).strftime('%Y-%m-%d')
-        for delta in (-1, 0, 1)
-    }
-
-    candidates = [e for e in all_events if date_only(e.get('commence_time')) in date_set]
-    match = None
-    for e in candidates:
-        home = e.get('home_team')
-        away = e.get('away_team')
-        if (norm(home) == norm(team2) and norm(away) == norm(team1)) or (norm(home) == norm(team1) and norm(away) == norm(team2)):
-            match = e
-            break
-
+    match = find_event(event_index, date, team1, team2)
     if not match or not match.get('id'):
         print(f"🚫 Skipping (no event id match): {team1} at {team2} on {date}")
         return None
@@ -101,10 +108,11 @@ def ensure_game_file(ev, all_events):
 def main():
     my_events = load_json(MY_EVENTS)
     all_events = load_json(EVENTS)
+    event_index = build_event_index(all_events)
 
     created = []
     for ev in my_events:
-        p = ensure_game_file(ev, all_events)
+        p = ensure_game_file(ev, event_index)
         if p is not None:
             created.append(p.name)
 